@@ -1,8 +1,10 @@
 import os
+import time
 from flask import Flask
-from config import MAX_CONTENT_LENGTH_MB  # don't import UPLOAD_FOLDER anymore
+from config import MAX_CONTENT_LENGTH_MB, WARM_UP_ON_START  # don't import UPLOAD_FOLDER anymore
 
 def create_app():
+    started = time.perf_counter()
     app = Flask(__name__)
 
     # Put uploads *inside* the app's static folder so url_for('static', ...) works
@@ -14,4 +16,22 @@ def create_app():
 
     from .routes import main
     app.register_blueprint(main)
+
+    if WARM_UP_ON_START:
+        warm_up()
+
+    # Keep an eye on import cost: cv2/openai are deferred, so this should stay small
+    app.config['STARTUP_MS'] = (time.perf_counter() - started) * 1000
+    app.logger.info("create_app took %.1f ms", app.config['STARTUP_MS'])
     return app
+
+def warm_up():
+    """
+    Optionally pay the heavy import/client cost up front (e.g. from a gunicorn
+    post_fork hook) instead of on the first upload / GPT request.
+    """
+    import cv2  # noqa: F401
+    from config import OPENAI_API_KEY
+    if OPENAI_API_KEY:
+        from .gpt_analyzer import get_client
+        get_client()
@@ -1,7 +1,25 @@
-from openai import OpenAI
+import os
+import threading
 from config import OPENAI_API_KEY
 
-client = OpenAI(api_key=OPENAI_API_KEY)
+# One client (and its HTTP connection pool) per process, built on first use.
+# Keyed by pid so a client created before a prefork server forks is never
+# shared with the children.
+_client = None
+_client_pid = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    global _client, _client_pid
+    pid = os.getpid()
+    if _client is None or _client_pid != pid:
+        with _client_lock:
+            if _client is None or _client_pid != pid:
+                from openai import OpenAI  # heavy; deferred until the first GPT call
+                _client = OpenAI(api_key=OPENAI_API_KEY)
+                _client_pid = pid
+    return _client
 
 SYSTEM_PROMPT = """
 You are a professional volleyball coach with NCAA Division I experience. 
@@ -44,7 +62,7 @@ def analyze_play(play_description: str, extra_context: str = "") -> str:
     )
 
     try:
-        resp = client.chat.completions.create(
+        resp = get_client().chat.completions.create(
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": SYSTEM_PROMPT},
@@ -85,7 +103,7 @@ def suggest_lineup(players: list, simple_lineup: dict) -> str:
         f"\n\nData:\n{payload}"
     )
 
-    resp = client.chat.completions.create(
+    resp = get_client().chat.completions.create(
         model="gpt-4o-mini",
         messages=[{"role":"system","content":"Be specific, compact, and practical."},
                   {"role":"user","content":prompt}],
@@ -118,7 +136,7 @@ def build_practice_schedule(players: list, struggle_counts: dict, *, days: str,
         f"Roster (names/roles): {[{'name':p.get('name'), 'role':p.get('role')} for p in players]}"
     )
 
-    resp = client.chat.completions.create(
+    resp = get_client().chat.completions.create(
         model="gpt-4o-mini",
         messages=[
             {"role":"system","content":"Return a structured plan with headings per day and time-block bullets."},
@@ -1,4 +1,3 @@
-import cv2
 import os
 
 def process_video(filepath: str, mode: str = "clip", interval_sec: int = 2):
@@ -12,6 +11,7 @@ def process_video(filepath: str, mode: str = "clip", interval_sec: int = 2):
     return _events_by_interval(filepath, interval_sec=interval_sec)
 
 def _events_by_interval(filepath: str, interval_sec: int = 2):
+    import cv2  # heavy; deferred so workers that never touch video skip it
     cap = cv2.VideoCapture(filepath)
     fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
     frame_interval = max(int(fps * max(1, interval_sec)), 1)
@@ -36,6 +36,7 @@ def _events_by_rally(filepath: str):
     - When motion stays low for a 'gap' window -> rally boundary.
     This is a heuristic (not perfect), but works well enough to split long matches.
     """
+    import cv2
     cap = cv2.VideoCapture(filepath)
     fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
     width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)) or 1280
@@ -9,3 +9,6 @@ ALLOWED_EXTENSIONS = {'mp4', 'avi', 'mov'}
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 
 MAX_CONTENT_LENGTH_MB = int(os.getenv("MAX_CONTENT_LENGTH_MB", "2048"))  # 2GB default
+
+# Import cv2 / build the OpenAI client in create_app() instead of on first use
+WARM_UP_ON_START = os.getenv("WARM_UP_ON_START", "").lower() in ("1", "true", "yes")